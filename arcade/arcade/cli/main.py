@@ -30,7 +30,7 @@ from arcade.cli.display import (
   display_tool_messages
   )
 from arcade.cli.launcher import start_servers
-from arcade.cli.model_client_wrapper import ModelClientWrapper
+from arcade.cli.model_client_wrapper import OpenAIModelClientWrapper
 from arcade.cli.show import show_logic
 from arcade.cli.utils import (
     OrderCommands,
@@ -246,18 +246,19 @@ def chat(
         # in case the user refers to relative dates (e.g. next Monday, last month, etc)
         today_context = get_today_context()
 
-        if prompt:
-            prompt = f"{today_context} {prompt}"
-        else:
-            prompt = today_context
-
-            history.append({"role": "system", "content": prompt})
+        prompt = f"{today_context} {prompt}" if prompt else today_context
+        history.append({"role": "system", "content": prompt})
 
         display_arcade_chat_header(base_url, stream)
 
         # Try to hit /health endpoint on engine and warn if it is down
         log_engine_health(client)
 
+        # Reuse one wrapper for the whole chat so its clients and connections persist
+        model_client_wrapper = OpenAIModelClientWrapper(
+            api_key=config.api.key, base_url=base_url, model=model
+        )
+
         while True:
             console.print(
                 f"\n[magenta][bold]User[/bold] {user_email}: [/magenta]"
@@ -277,19 +278,21 @@ def chat(
             history.append({"role": "user", "content": user_input})
 
             try:
-                model_client_wrapper = ModelClientWrapper(api_key=config.api.key, base_url=base_url, model=model)
-
                 chat_result = model_client_wrapper.handle_chat_interaction(history, user_email, stream)
 
                 history = chat_result.history
                 tool_messages = chat_result.tool_messages
-                tool_authorization = chat_result.tool_authorization
+                pending_authorizations = [
+                    AuthorizationResponse.model_validate(tool_authorization)
+                    for tool_authorization in chat_result.tool_authorizations
+                    if is_authorization_pending(tool_authorization)
+                ]
 
                 # wait for tool authorizations to complete, if any
-                if tool_authorization and is_authorization_pending(tool_authorization):
+                if pending_authorizations:
                     chat_result = model_client_wrapper.handle_tool_authorization(
                         client,
-                        AuthorizationResponse.model_validate(tool_authorization),
+                        pending_authorizations,
                         history,
                         user_email,
                         stream,
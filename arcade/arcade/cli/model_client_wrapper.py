@@ -1,50 +1,234 @@
+import asyncio
+import functools
+import hashlib
+import json
+import threading
 import webbrowser
-from typing import Any, Optional
+from abc import ABC, abstractmethod
+from collections import OrderedDict
 from dataclasses import dataclass
+from typing import Any, Callable, Optional
 
-from arcadepy import Arcade
+from arcadepy import Arcade, AsyncArcade
 from arcadepy.types import AuthorizationResponse
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 from rich.console import Console
 from rich.live import Live
 from rich.markdown import Markdown
 from rich.text import Text
 
-from arcade.cli.utils import (get_tool_authorization, get_tool_messages,
-                              handle_streaming_content, markdownify_urls,
-                              wait_for_authorization_completion)
+from arcade.cli.utils import (
+    ChatResponseResult,
+    ahandle_streaming_content,
+    await_authorization_completion,
+    display_chat_message,
+    get_tool_authorizations,
+    get_tool_messages,
+    handle_streaming_content,
+    markdownify_urls,
+    wait_for_authorization_completion,
+)
 
 console = Console()
 
+# Maximum number of non-streamed chat responses kept in the wrapper's response cache
+RESPONSE_CACHE_SIZE = 128
+
+AUTHORIZATION_COMPLETED_MESSAGE = "Thanks for authorizing the action! Sending your request..."
+
+
 @dataclass
 class ChatInteractionResult:
     history: list[dict]
     tool_messages: list[dict]
-    tool_authorization: dict | None
+    tool_authorizations: list[dict]
+
+
+def get_authorization_message(authorization_urls: list[str]) -> str:
+    """
+    Get the message asking the user to authorize one or more actions in their browser.
+    """
+    if len(authorization_urls) == 1:
+        authorization_url = authorization_urls[0]
+        return (
+            "You'll need to authorize this action in your browser.\n\n"
+            f"If a browser doesn't open automatically, click [this link]({authorization_url}) "
+            f"or copy this URL and paste it into your browser:\n\n{authorization_url}"
+        )
+
+    links = "\n".join(f"- [{url}]({url})" for url in authorization_urls)
+    return (
+        "You'll need to authorize these actions in your browser.\n\n"
+        "If a browser doesn't open automatically, click these links "
+        f"or copy the URLs and paste them into your browser:\n\n{links}"
+    )
+
+
+def open_in_browser(url: str) -> None:
+    """
+    Open the URL in the user's browser from a background thread, since launching the browser
+    can block for a while and would delay waiting for the authorization.
+    """
+    threading.Thread(target=webbrowser.open, args=(url,), daemon=True).start()
+
+
+def open_authorization_urls(tool_authorizations: list[AuthorizationResponse]) -> Markdown | None:
+    """
+    Open the authorization links in the browser and return the prompt to display, if any.
+    """
+    authorization_urls = [str(auth.url) for auth in tool_authorizations if auth.url]
+    if not authorization_urls:
+        return None
+
+    for authorization_url in authorization_urls:
+        open_in_browser(authorization_url)
+    return Markdown(get_authorization_message(authorization_urls), style="dim")
 
 
-class ModelClientWrapper:
-    def __init__(self, api_key: str, base_url: str = None, model: str = "gpt-3.5-turbo"):
+class ModelClientWrapper(ABC):
+    """
+    Base wrapper around a model client for `arcade chat`.
+
+    Each kind of model client is a subclass implementing `_send` and `_asend`, such as
+    `OpenAIModelClientWrapper` for the Arcade Engine's OpenAI-compatible API.
+    """
+
+    def __init__(
+        self, api_key: str, base_url: str | None = None, model: str = "gpt-3.5-turbo"
+    ) -> None:
         self.api_key = api_key
-        self.base_url = base_url or "https://api.arcade.dev/v1"  # Default to OpenAI if base_url is None
+        # Default to OpenAI if base_url is None
+        self.base_url = base_url or "https://api.arcade.dev/v1"
         self.model = model.lower()
+        self._response_cache: OrderedDict[str, Any] = OrderedDict()
 
+    @abstractmethod
+    def _send(
+        self,
+        messages: Optional[list],
+        user_email: Optional[str],
+        stream: bool,
+        generate: bool = False,
+    ) -> Any:
+        """
+        Send the messages to the model and return the client's response.
 
-    def chat(self, history: Optional[list] = None, user_email: Optional[str] = None, stream: bool = False):
-        # Handle chat interaction based on the client type
-        if self.client_type == "openai":
-            # Assuming OpenAI client has chat support
-            return self.client.chat.completions.create(
-                model=self.model,
-                messages=history,
-                user=user_email,
-                stream=stream
-            )
-        elif self.client_type == "anthropic":
-            # Handle chat with Anthropic (replace with real client code)
-            return self._handle_anthropic_chat(self.model, history, user_email, stream)
+        With `generate`, the Arcade Engine executes the requested tools and generates the final
+        response itself (`tool_choice="generate"`).
+        """
+
+    @abstractmethod
+    async def _asend(
+        self,
+        messages: Optional[list],
+        user_email: Optional[str],
+        stream: bool,
+        generate: bool = False,
+    ) -> Any:
+        """
+        Async counterpart of `_send`.
+        """
+
+    def _response_cache_key(self, history: Optional[list], user_email: Optional[str]) -> str:
+        payload = json.dumps([self.model, user_email, history], sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def _get_cached_response(self, key: str) -> Any:
+        response = self._response_cache.get(key)
+        if response is not None:
+            self._response_cache.move_to_end(key)
+        return response
+
+    def _cache_response(self, key: str, response: Any) -> None:
+        self._response_cache[key] = response
+        if len(self._response_cache) > RESPONSE_CACHE_SIZE:
+            self._response_cache.popitem(last=False)
+
+    def _get_cached_chat_response(
+        self, history: Optional[list], user_email: Optional[str], stream: bool, use_cache: bool
+    ) -> tuple[str | None, Any]:
+        """
+        Get the cache key of a chat request and its cached response, if any.
+
+        The key is None when the request is not cached, i.e. without `use_cache` or when the
+        response is streamed.
+        """
+        if stream or not use_cache:
+            return None, None
+        cache_key = self._response_cache_key(history, user_email)
+        return cache_key, self._get_cached_response(cache_key)
+
+    def chat(
+        self,
+        history: Optional[list] = None,
+        user_email: Optional[str] = None,
+        stream: bool = False,
+        use_cache: bool = False,
+    ) -> Any:
+        """
+        Send the history to the model and return its response.
+
+        With `use_cache=True`, non-streamed responses are cached by model, user and messages, so
+        repeating the exact same request returns the previous response without calling the API
+        again.
+
+        Cached responses are shared between calls, so callers must not mutate them.
+        """
+        cache_key, response = self._get_cached_chat_response(history, user_email, stream, use_cache)
+        if response is None:
+            response = self._send(history, user_email, stream)
+            if cache_key is not None:
+                self._cache_response(cache_key, response)
+        return response
+
+    async def achat(
+        self,
+        history: Optional[list] = None,
+        user_email: Optional[str] = None,
+        stream: bool = False,
+        use_cache: bool = False,
+    ) -> Any:
+        """
+        Async counterpart of `chat` so several chat requests can interleave on one event loop.
+        """
+        cache_key, response = self._get_cached_chat_response(history, user_email, stream, use_cache)
+        if response is None:
+            response = await self._asend(history, user_email, stream)
+            if cache_key is not None:
+                self._cache_response(cache_key, response)
+        return response
+
+    def _handle_response(self, response: Any) -> ChatResponseResult:
+        """
+        Display a non-streamed chat response and get its message, tool messages and tool
+        authorizations.
+        """
+        choice = response.choices[0]
+        message = choice.message
+        message_content = message.content or ""
+
+        # Get extra fields from the response
+        tool_messages = get_tool_messages(choice)
+        tool_authorizations = get_tool_authorizations(choice)
+
+        role = message.role
+        if role == "assistant" and not tool_authorizations:
+            message_content = markdownify_urls(message_content)
+        display_chat_message(role, message_content, self.model, bool(tool_authorizations))
+
+        return ChatResponseResult(role, message_content, tool_messages, tool_authorizations)
+
+    @staticmethod
+    def _update_history(history: list[dict], result: ChatResponseResult) -> ChatInteractionResult:
+        """
+        Add the response's tool messages and message to the history.
+        """
+        history.extend([
+            *result.tool_messages,
+            {"role": result.role, "content": result.full_message},
+        ])
+        return ChatInteractionResult(history, result.tool_messages, result.tool_authorizations)
 
-    
     def handle_chat_interaction(
         self, history: list[dict], user_email: str | None, stream: bool = False
     ) -> ChatInteractionResult:
@@ -56,78 +240,136 @@ class ModelClientWrapper:
         - Getting the tool messages and tool authorization from the response
         - Updating the history with the response, tool calls, and tool responses
         """
+        response = self._send(history, user_email, stream=stream, generate=True)
         if stream:
-            # TODO Fix this in the client so users don't deal with these
-            # typing issues
-            response = client.chat.completions.create(  # type: ignore[call-overload]
-                model=self.model,
-                messages=history,
-                tool_choice="generate",
-                user=user_email,
-                stream=True,
-            )
-            streaming_result = handle_streaming_content(response, self.model)
-            role, message_content = streaming_result.role, streaming_result.full_message
-            tool_messages, tool_authorization = (
-                streaming_result.tool_messages,
-                streaming_result.tool_authorization,
-            )
+            result = handle_streaming_content(response, self.model)
         else:
-            response = client.chat.completions.create(  # type: ignore[call-overload]
-                model=self.model,
-                messages=history,
-                tool_choice="generate",
-                user=user_email,
-                stream=False,
-            )
-            message_content = response.choices[0].message.content or ""
+            result = self._handle_response(response)
+        return self._update_history(history, result)
 
-            # Get extra fields from the response
-            tool_messages = get_tool_messages(response.choices[0])
-            tool_authorization = get_tool_authorization(response.choices[0])
+    async def ahandle_chat_interaction(
+        self,
+        history: list[dict],
+        user_email: str | None,
+        stream: bool = False,
+        live: Live | None = None,
+    ) -> ChatInteractionResult:
+        """
+        Async counterpart of `handle_chat_interaction`.
 
-            role = response.choices[0].message.role
+        Awaits the chat request instead of blocking on it, so callers can fan out over several
+        conversations with `asyncio.gather`. Pass a started `live` display to render a streamed
+        response as it comes in; without one, streamed responses are displayed once complete so
+        that concurrent calls don't compete for the console (see `ahandle_streaming_content`).
+        """
+        response = await self._asend(history, user_email, stream=stream, generate=True)
+        if stream:
+            result = await ahandle_streaming_content(response, self.model, live)
+        else:
+            result = self._handle_response(response)
+        return self._update_history(history, result)
 
-            if role == "assistant" and tool_authorization:
-                pass  # Skip the message if it's an auth request (handled later in handle_tool_authorization)
-            elif role == "assistant":
-                message_content = markdownify_urls(message_content)
-                console.print(
-                    f"\n[blue][bold]Assistant[/bold] ({self.model}):[/blue] ", Markdown(message_content)
-                )
-            else:
-                console.print(f"\n[bold]{role}:[/bold] {message_content}")
+    def handle_tool_authorization(
+        self,
+        arcade_client: Arcade,
+        tool_authorizations: list[AuthorizationResponse],
+        history: list[dict[str, Any]],
+        user_email: str | None,
+        stream: bool,
+    ) -> ChatInteractionResult:
+        """
+        Wait for the user to complete the given tool authorizations, then resend the request.
 
-        history += tool_messages
-        history.append({"role": role, "content": message_content})
+        All authorization links are opened before waiting, so the user can complete them in
+        parallel and the total wait is that of the slowest authorization.
+        """
+        # The display only changes before and after waiting, so refresh it explicitly instead of
+        # re-rendering it periodically for as long as the user takes to authorize
+        with Live(console=console, auto_refresh=False) as live:
+            prompt = open_authorization_urls(tool_authorizations)
+            if prompt:
+                live.update(prompt, refresh=True)
 
-        return ChatInteractionResult(history, tool_messages, tool_authorization)
-    
+            for tool_authorization in tool_authorizations:
+                wait_for_authorization_completion(arcade_client, tool_authorization)
 
-    def handle_tool_authorization(
+            live.update(Text(AUTHORIZATION_COMPLETED_MESSAGE, style="dim"), refresh=True)
+
+        history.pop()
+        return self.handle_chat_interaction(history, user_email, stream)
+
+    async def ahandle_tool_authorization(
         self,
-        arcade_client: Arcade,
-        tool_authorization: AuthorizationResponse,
+        arcade_client: AsyncArcade,
+        tool_authorizations: list[AuthorizationResponse],
         history: list[dict[str, Any]],
         user_email: str | None,
         stream: bool,
     ) -> ChatInteractionResult:
-        with Live(console=console, refresh_per_second=4) as live:
-            if tool_authorization.url:
-                authorization_url = str(tool_authorization.url)
-                webbrowser.open(authorization_url)
-                message = (
-                    "You'll need to authorize this action in your browser.\n\n"
-                    f"If a browser doesn't open automatically, click [this link]({authorization_url}) "
-                    f"or copy this URL and paste it into your browser:\n\n{authorization_url}"
-                )
-                live.update(Markdown(message, style="dim"))
-
-            wait_for_authorization_completion(arcade_client, tool_authorization)
-
-            message = "Thanks for authorizing the action! Sending your request..."
-            live.update(Text(message, style="dim"))
+        """
+        Async counterpart of `handle_tool_authorization` that awaits all the authorizations
+        concurrently.
+
+        The prompts are printed instead of shown in a live display, since only one live display
+        can be active on a console at a time.
+        """
+        prompt = open_authorization_urls(tool_authorizations)
+        if prompt:
+            console.print(prompt)
+
+        await asyncio.gather(
+            *(
+                await_authorization_completion(arcade_client, tool_authorization)
+                for tool_authorization in tool_authorizations
+            )
+        )
+
+        console.print(Text(AUTHORIZATION_COMPLETED_MESSAGE, style="dim"))
 
         history.pop()
-        return self.handle_chat_interaction(self.model, history, user_email, stream)
+        return await self.ahandle_chat_interaction(history, user_email, stream)
+
+
+class OpenAIModelClientWrapper(ModelClientWrapper):
+    """
+    Wrapper around the OpenAI clients, used for the Arcade Engine's OpenAI-compatible API.
+    """
+
+    def __init__(
+        self, api_key: str, base_url: str | None = None, model: str = "gpt-3.5-turbo"
+    ) -> None:
+        super().__init__(api_key, base_url, model)
+        # The clients live as long as the wrapper, so requests reuse their keep-alive connections
+        self.client = OpenAI(api_key=self.api_key, base_url=self.base_url)
+        self.aclient = AsyncOpenAI(api_key=self.api_key, base_url=self.base_url)
+        # Bind the completion endpoints and tool_choice once instead of walking the client and
+        # rebuilding the arguments on every request. The model stays a per-call argument, so
+        # changing `self.model` takes effect on the next request.
+        self._create_completion: Callable[..., Any] = self.client.chat.completions.create
+        self._acreate_completion: Callable[..., Any] = self.aclient.chat.completions.create
+        self._create_generated_completion: Callable[..., Any] = functools.partial(
+            self._create_completion, tool_choice="generate"
+        )
+        self._acreate_generated_completion: Callable[..., Any] = functools.partial(
+            self._acreate_completion, tool_choice="generate"
+        )
 
+    def _send(
+        self,
+        messages: Optional[list],
+        user_email: Optional[str],
+        stream: bool,
+        generate: bool = False,
+    ) -> Any:
+        create = self._create_generated_completion if generate else self._create_completion
+        return create(model=self.model, messages=messages, user=user_email, stream=stream)
+
+    async def _asend(
+        self,
+        messages: Optional[list],
+        user_email: Optional[str],
+        stream: bool,
+        generate: bool = False,
+    ) -> Any:
+        create = self._acreate_generated_completion if generate else self._acreate_completion
+        return await create(model=self.model, messages=messages, user=user_email, stream=stream)
@@ -1,8 +1,10 @@
 import importlib.util
 import ipaddress
+import re
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
 from textwrap import dedent
 from typing import Callable, Union, cast
@@ -10,14 +12,23 @@ from urllib.parse import urlencode, urlparse
 
 import idna
 import typer
-from arcadepy import NOT_GIVEN, APIConnectionError, APIStatusError, APITimeoutError, Arcade
+from arcadepy import (
+    NOT_GIVEN,
+    APIConnectionError,
+    APIStatusError,
+    APITimeoutError,
+    Arcade,
+    AsyncArcade,
+)
 from arcadepy.types import AuthorizationResponse
-from openai import Stream
+from openai import AsyncStream, Stream
 from openai.types.chat.chat_completion import Choice as ChatCompletionChoice
 from openai.types.chat.chat_completion_chunk import ChatCompletionChunk
 from openai.types.chat.chat_completion_chunk import Choice as ChatCompletionChunkChoice
-from rich.console import Console
+from rich.console import Console, ConsoleOptions, RenderResult
+from rich.live import Live
 from rich.markdown import Markdown
+from rich.text import Text
 from typer.core import TyperGroup
 from typer.models import Context
 
@@ -29,6 +40,14 @@ from arcade.sdk import ToolCatalog, Toolkit
 
 console = Console()
 
+# Matches URLs that are not already formatted as markdown links: [Link text](https://example.com)
+URL_PATTERN = re.compile(r"(?<!\]\()https?://\S+")
+
+# Number of new characters after which a streamed message is parsed as markdown again
+STREAMING_RENDER_CHARS = 64
+
+ASSISTANT_LABEL = Text.from_markup("\n[blue][bold]Assistant[/bold][/blue]")
+
 
 class OrderCommands(TyperGroup):
     def list_commands(self, ctx: Context) -> list[str]:  # type: ignore[override]
@@ -214,69 +233,183 @@ def get_tool_messages(choice: dict) -> list[dict]:
 
 
 @dataclass
-class StreamingResult:
+class ChatResponseResult:
     role: str
     full_message: str
     tool_messages: list
-    tool_authorization: dict | None
+    tool_authorizations: list[dict]
+
+
+class StreamingMarkdown:
+    """
+    A renderable for a message that is being streamed in.
+
+    Chunks are buffered and only parsed as markdown when Rich refreshes the display, so the
+    parsing cost is bounded by the refresh rate instead of growing with every streamed chunk.
+    The parsed markdown is also reused across refreshes until a new line or enough new text
+    has arrived.
+    """
+
+    def __init__(self) -> None:
+        self.parts: list[str] = []
+        self._length = 0
+        self._rendered_length = 0
+        self._has_new_line = False
+        self._markdown = Markdown("")
+
+    def append(self, chunk: str) -> None:
+        self.parts.append(chunk)
+        self._length += len(chunk)
+        self._has_new_line = self._has_new_line or "\n" in chunk
+
+    @property
+    def text(self) -> str:
+        return "".join(self.parts)
+
+    def __rich_console__(self, console: Console, options: ConsoleOptions) -> RenderResult:
+        pending_length = self._length - self._rendered_length
+        if pending_length and (self._has_new_line or pending_length > STREAMING_RENDER_CHARS):
+            self._markdown = Markdown(self.text)
+            self._rendered_length = self._length
+            self._has_new_line = False
+        yield self._markdown
+
+
+@lru_cache
+def get_assistant_header(model: str) -> Text:
+    """
+    Get the header printed before the assistant's replies, built once per model.
+    """
+    return Text.assemble(ASSISTANT_LABEL, Text(f" ({model}): ", style="blue"))
+
+
+class StreamingResponse:
+    """
+    Collects the chunks of a streamed chat response.
+    """
+
+    def __init__(self) -> None:
+        self.role = ""
+        self.content = StreamingMarkdown()
+        self.tool_messages: list = []
+        self.tool_authorizations: list[dict] = []
+
+    def add_chunk(self, chunk: ChatCompletionChunk) -> bool:
+        """
+        Add a streamed chunk and return whether it is part of a message to display.
+        """
+        choice = chunk.choices[0]
+        self.role = choice.delta.role or self.role
+
+        # Get tool messages and tool authorizations if they exist
+        self.tool_messages += get_tool_messages(choice)  # type: ignore[arg-type]
+        self.tool_authorizations += get_tool_authorizations(choice)
+
+        if self.role == "assistant" and self.tool_authorizations:
+            return False  # Skip the message if it's an auth request (handled later in handle_tool_authorization)
+
+        if choice.delta.content:
+            self.content.append(choice.delta.content)
+        return True
+
+    def result(self) -> ChatResponseResult:
+        full_message = self.content.text
+
+        # Markdownify URLs in the final message if applicable
+        if self.role == "assistant":
+            full_message = markdownify_urls(full_message)
+
+        return ChatResponseResult(
+            self.role,
+            full_message,
+            self.tool_messages,
+            self.tool_authorizations,
+        )
+
+
+def display_chat_message(
+    role: str, message: str, model: str, is_authorization_request: bool = False
+) -> None:
+    """
+    Display a complete chat message in the console.
+    """
+    if role == "assistant" and is_authorization_request:
+        return  # Skip the message if it's an auth request (handled later in handle_tool_authorization)
+
+    if role == "assistant":
+        console.print(get_assistant_header(model), Markdown(message))
+    else:
+        console.print(f"\n[bold]{role}:[/bold] {message}")
 
 
 # TODO: Don't rely on OpenAI Stream
-def handle_streaming_content(stream: Stream[ChatCompletionChunk], model: str) -> StreamingResult:
+def handle_streaming_content(stream: Stream[ChatCompletionChunk], model: str) -> ChatResponseResult:
     """
     Display the streamed markdown chunks as a single line.
     """
-    from rich.live import Live
-
-    full_message = ""
-    tool_messages = []
-    tool_authorization = None
-    role = ""
+    response = StreamingResponse()
     printed_role: bool = False
 
-    with Live(console=console, refresh_per_second=10) as live:
+    with Live(response.content, console=console, refresh_per_second=8) as live:
         for chunk in stream:
-            choice = chunk.choices[0]
-            role = choice.delta.role or role
+            if response.add_chunk(chunk) and response.role == "assistant" and not printed_role:
+                console.print(get_assistant_header(model))
+                printed_role = True
 
-            # Display and get tool messages if they exist
-            tool_messages += get_tool_messages(choice)  # type: ignore[arg-type]
-            tool_authorization = get_tool_authorization(choice)
+        result = response.result()
 
-            chunk_message = choice.delta.content
+        # Render the complete message, including any text not yet rendered by the live display
+        live.update(Markdown(result.full_message))
 
-            if role == "assistant" and tool_authorization:
-                continue  # Skip the message if it's an auth request (handled later in handle_tool_authorization)
+    return result
 
-            if role == "assistant" and not printed_role:
-                console.print(f"\n[blue][bold]Assistant[/bold] ({model}):[/blue] ")
-                printed_role = True
 
-            if chunk_message:
-                full_message += chunk_message
-                markdown_chunk = Markdown(full_message)
-                live.update(markdown_chunk)
+async def ahandle_streaming_content(
+    stream: AsyncStream[ChatCompletionChunk], model: str, live: Live | None = None
+) -> ChatResponseResult:
+    """
+    Async counterpart of `handle_streaming_content` for streams from the `AsyncOpenAI` client.
 
-        # Markdownify URLs in the final message if applicable
-        if role == "assistant":
-            full_message = markdownify_urls(full_message)
-            live.update(Markdown(full_message))
+    With a started `live` display, the message is rendered in it while it streams in. Only one
+    live display can be active on a console at a time, so without one the message is displayed
+    once it is complete instead, which lets several streams be consumed concurrently.
+    """
+    response = StreamingResponse()
+    printed_role: bool = False
 
-    return StreamingResult(role, full_message, tool_messages, tool_authorization)
+    if live is not None:
+        live.update(response.content)
+
+    async for chunk in stream:
+        if (
+            response.add_chunk(chunk)
+            and live is not None
+            and response.role == "assistant"
+            and not printed_role
+        ):
+            live.console.print(get_assistant_header(model))
+            printed_role = True
+
+    result = response.result()
+    if live is None:
+        display_chat_message(
+            result.role, result.full_message, model, bool(result.tool_authorizations)
+        )
+    else:
+        # Render the complete message, including any text not yet rendered by the live display
+        live.update(Markdown(result.full_message), refresh=True)
+    return result
 
 
 def markdownify_urls(message: str) -> str:
     """
     Convert URLs in the message to markdown links.
     """
-    import re
-
-    # This regex will match URLs that are not already formatted as markdown links:
-    # [Link text](https://example.com)
-    url_pattern = r"(?<!\]\()https?://\S+"
+    if "://" not in message:
+        return message
 
     # Wrap all URLs in the message with markdown links
-    return re.sub(url_pattern, r"[Link](\g<0>)", message)
+    return URL_PATTERN.sub(r"[Link](\g<0>)", message)
 
 
 def validate_and_get_config(
@@ -334,6 +467,19 @@ def log_engine_health(client: Arcade) -> None:
         )
 
 
+def get_pending_authorization(
+    tool_authorization: AuthorizationResponse | None,
+) -> AuthorizationResponse | None:
+    """
+    Get the tool authorization if it still needs to be completed, otherwise None.
+    """
+    if tool_authorization is None:
+        return None
+
+    auth_response = AuthorizationResponse.model_validate(tool_authorization)
+    return None if auth_response.status == "completed" else auth_response
+
+
 def wait_for_authorization_completion(
     client: Arcade, tool_authorization: AuthorizationResponse | None
 ) -> None:
@@ -341,30 +487,44 @@ def wait_for_authorization_completion(
     Wait for the authorization for a tool call to complete i.e., wait for the user to click on
     the approval link and authorize Arcade.
     """
-    if tool_authorization is None:
-        return
+    auth_response = get_pending_authorization(tool_authorization)
 
-    auth_response = AuthorizationResponse.model_validate(tool_authorization)
+    while auth_response is not None:
+        try:
+            auth_response = get_pending_authorization(
+                client.auth.status(id=cast(str, auth_response.id), wait=59)
+            )
+        except APITimeoutError:
+            continue
 
-    while auth_response.status != "completed":
+
+async def await_authorization_completion(
+    client: AsyncArcade, tool_authorization: AuthorizationResponse | None
+) -> None:
+    """
+    Async counterpart of `wait_for_authorization_completion`, so several authorizations can be
+    awaited at the same time.
+    """
+    auth_response = get_pending_authorization(tool_authorization)
+
+    while auth_response is not None:
         try:
-            auth_response = client.auth.status(
-                id=cast(str, auth_response.id),
-                wait=59,
+            auth_response = get_pending_authorization(
+                await client.auth.status(id=cast(str, auth_response.id), wait=59)
             )
         except APITimeoutError:
             continue
 
 
-def get_tool_authorization(
+def get_tool_authorizations(
     choice: Union[ChatCompletionChoice, ChatCompletionChunkChoice],
-) -> dict | None:
+) -> list[dict]:
     """
-    Get the tool authorization from a chat response's choice.
+    Get all the tool authorizations from a chat response's choice.
     """
     if hasattr(choice, "tool_authorizations") and choice.tool_authorizations:
-        return choice.tool_authorizations[0]  # type: ignore[no-any-return]
-    return None
+        return choice.tool_authorizations  # type: ignore[no-any-return]
+    return []
 
 
 def is_authorization_pending(tool_authorization: dict | None) -> bool:
@@ -526,7 +686,8 @@ def handle_user_command(
         return True
     elif user_input == ChatCommand.CLEAR:
         console.print("Chat history cleared.", style="bold green")
-        history.clear()
+        # Keep the system prompt so requests still start with the same, cacheable prompt prefix
+        del history[count_system_prompt_messages(history) :]
         return True
     elif user_input == ChatCommand.SHOW:
         show(
@@ -543,6 +704,16 @@ def handle_user_command(
     return False
 
 
+def count_system_prompt_messages(history: list) -> int:
+    """
+    Count the system messages at the start of the history, which make up its system prompt.
+    """
+    count = 0
+    while count < len(history) and history[count].get("role") == "system":
+        count += 1
+    return count
+
+
 def parse_user_command(user_input: str) -> ChatCommand | None:
     """
     Parse the user command and return the corresponding ChatCommand enum.
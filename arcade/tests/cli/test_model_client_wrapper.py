@@ -0,0 +1,217 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from arcadepy.types import AuthorizationResponse
+from rich.console import Console
+from rich.live import Live
+
+import arcade.cli.model_client_wrapper as model_client_wrapper
+from arcade.cli.model_client_wrapper import (
+    ModelClientWrapper,
+    OpenAIModelClientWrapper,
+    get_authorization_message,
+)
+
+SYSTEM_MESSAGE = {"role": "system", "content": "Today is 2024-10-15, Tuesday."}
+
+
+def make_chunk(content: str, role: str | None = None) -> SimpleNamespace:
+    delta = SimpleNamespace(role=role, content=content)
+    return SimpleNamespace(choices=[SimpleNamespace(delta=delta)])
+
+
+async def fake_stream(*contents: str):
+    yield make_chunk(contents[0], role="assistant")
+    for content in contents[1:]:
+        # Hand control back to the event loop so concurrent streams interleave
+        await asyncio.sleep(0)
+        yield make_chunk(content)
+
+
+@pytest.fixture
+def wrapper() -> OpenAIModelClientWrapper:
+    return OpenAIModelClientWrapper(api_key="test-key", base_url="http://localhost:9099/v1")
+
+
+def test_handle_chat_interaction_sends_each_history_as_given(
+    wrapper: OpenAIModelClientWrapper, monkeypatch: pytest.MonkeyPatch
+):
+    sent_messages = []
+
+    def create(model, messages, user, stream):
+        sent_messages.append(list(messages))
+        message = SimpleNamespace(content="Hi!", role="assistant")
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+    monkeypatch.setattr(wrapper, "_create_generated_completion", create)
+    other_system_message = {"role": "system", "content": "Another prompt"}
+    user_message = {"role": "user", "content": "Hello"}
+
+    # The system prompt of one conversation never leaks into another one
+    wrapper.handle_chat_interaction([SYSTEM_MESSAGE, user_message], "user@example.com")
+    wrapper.handle_chat_interaction([other_system_message, user_message], "user@example.com")
+    wrapper.handle_chat_interaction([user_message], "user@example.com")
+
+    assert sent_messages == [
+        [SYSTEM_MESSAGE, user_message],
+        [other_system_message, user_message],
+        [user_message],
+    ]
+
+
+def test_chat_returns_cached_response_for_repeated_request(
+    wrapper: OpenAIModelClientWrapper, monkeypatch: pytest.MonkeyPatch
+):
+    calls = []
+
+    def create(**kwargs):
+        calls.append(kwargs)
+        return object()
+
+    monkeypatch.setattr(wrapper, "_create_completion", create)
+    history = [SYSTEM_MESSAGE, {"role": "user", "content": "Hello"}]
+
+    first = wrapper.chat(history, "user@example.com", use_cache=True)
+    assert wrapper.chat(list(history), "user@example.com", use_cache=True) is first
+    assert len(calls) == 1
+
+    # Different users and streamed requests are never served from the cache
+    wrapper.chat(history, "other@example.com", use_cache=True)
+    wrapper.chat(history, "user@example.com", stream=True, use_cache=True)
+    assert len(calls) == 3
+
+
+def test_model_client_wrapper_requires_a_client_subclass():
+    with pytest.raises(TypeError):
+        ModelClientWrapper(api_key="test-key")  # type: ignore[abstract]
+
+    wrapper = OpenAIModelClientWrapper(api_key="test-key")
+    assert wrapper.base_url == "https://api.arcade.dev/v1"
+    assert wrapper.model == "gpt-3.5-turbo"
+
+
+@pytest.mark.asyncio
+async def test_ahandle_chat_interaction_streams_conversations_concurrently(
+    wrapper: OpenAIModelClientWrapper, monkeypatch: pytest.MonkeyPatch
+):
+    replies = {"First": ("One, ", "two."), "Second": ("Three, ", "four.")}
+
+    async def create(model, messages, user, stream):
+        return fake_stream(*replies[messages[-1]["content"]])
+
+    monkeypatch.setattr(wrapper, "_acreate_generated_completion", create)
+    histories = [
+        [SYSTEM_MESSAGE, {"role": "user", "content": "First"}],
+        [SYSTEM_MESSAGE, {"role": "user", "content": "Second"}],
+    ]
+
+    results = await asyncio.gather(
+        *(
+            wrapper.ahandle_chat_interaction(history, "user@example.com", stream=True)
+            for history in histories
+        )
+    )
+
+    assert [result.history[-1] for result in results] == [
+        {"role": "assistant", "content": "One, two."},
+        {"role": "assistant", "content": "Three, four."},
+    ]
+
+
+def test_chat_does_not_cache_by_default(
+    wrapper: OpenAIModelClientWrapper, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr(wrapper, "_create_completion", lambda **kwargs: object())
+    history = [SYSTEM_MESSAGE, {"role": "user", "content": "Hello"}]
+
+    first = wrapper.chat(history, "user@example.com")
+
+    assert wrapper.chat(history, "user@example.com") is not first
+    # Uncached responses are not stored either
+    assert wrapper.chat(history, "user@example.com", use_cache=True) is not first
+
+
+def test_get_authorization_message_for_one_url():
+    message = get_authorization_message(["https://auth.example.com/1"])
+
+    assert message.startswith("You'll need to authorize this action in your browser.")
+    assert "[this link](https://auth.example.com/1)" in message
+
+
+def test_get_authorization_message_for_multiple_urls():
+    urls = ["https://auth.example.com/1", "https://auth.example.com/2"]
+
+    message = get_authorization_message(urls)
+
+    assert message.startswith("You'll need to authorize these actions in your browser.")
+    assert "- [https://auth.example.com/1](https://auth.example.com/1)" in message
+    assert "- [https://auth.example.com/2](https://auth.example.com/2)" in message
+
+
+def test_handle_tool_authorization_opens_all_urls_before_waiting(
+    wrapper: OpenAIModelClientWrapper, monkeypatch: pytest.MonkeyPatch
+):
+    events = []
+    monkeypatch.setattr(
+        model_client_wrapper, "open_in_browser", lambda url: events.append(("open", url))
+    )
+    monkeypatch.setattr(
+        model_client_wrapper,
+        "wait_for_authorization_completion",
+        lambda client, auth: events.append(("wait", auth.id)),
+    )
+    monkeypatch.setattr(
+        wrapper, "handle_chat_interaction", lambda history, user_email, stream: history
+    )
+    tool_authorizations = [
+        AuthorizationResponse(id=str(i), status="pending", url=f"https://auth.example.com/{i}")
+        for i in range(2)
+    ]
+    history = [{"role": "user", "content": "Hello"}, {"role": "assistant", "content": ""}]
+
+    result = wrapper.handle_tool_authorization(
+        None, tool_authorizations, history, "user@example.com", False
+    )
+
+    assert events == [
+        ("open", "https://auth.example.com/0"),
+        ("open", "https://auth.example.com/1"),
+        ("wait", "0"),
+        ("wait", "1"),
+    ]
+    # The authorization request is removed before the request is sent again
+    assert result == [{"role": "user", "content": "Hello"}]
+
+
+def test_send_uses_current_model(
+    wrapper: OpenAIModelClientWrapper, monkeypatch: pytest.MonkeyPatch
+):
+    calls = []
+    monkeypatch.setattr(wrapper, "_create_completion", lambda **kwargs: calls.append(kwargs))
+
+    wrapper.model = "gpt-4o"
+    wrapper.chat([{"role": "user", "content": "Hello"}], "user@example.com", stream=True)
+
+    assert calls[0]["model"] == "gpt-4o"
+
+
+@pytest.mark.asyncio
+async def test_ahandle_chat_interaction_renders_stream_in_live_display(
+    wrapper: OpenAIModelClientWrapper, monkeypatch: pytest.MonkeyPatch
+):
+    async def create(model, messages, user, stream):
+        return fake_stream("One, ", "two.")
+
+    monkeypatch.setattr(wrapper, "_acreate_generated_completion", create)
+    console = Console(record=True, width=40)
+
+    with Live(console=console) as live:
+        result = await wrapper.ahandle_chat_interaction(
+            [{"role": "user", "content": "Count"}], "user@example.com", stream=True, live=live
+        )
+
+    assert result.history[-1] == {"role": "assistant", "content": "One, two."}
+    output = console.export_text()
+    assert "Assistant (gpt-3.5-turbo):" in output
+    assert "One, two." in output
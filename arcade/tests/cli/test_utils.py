@@ -1,6 +1,16 @@
+from types import SimpleNamespace
+
 import pytest
+from rich.console import Console
 
-from arcade.cli.utils import compute_base_url, compute_login_url
+from arcade.cli.utils import (
+    StreamingMarkdown,
+    StreamingResponse,
+    compute_base_url,
+    compute_login_url,
+    handle_user_command,
+    markdownify_urls,
+)
 
 DEFAULT_CLOUD_HOST = "cloud.arcade.dev"
 DEFAULT_ENGINE_HOST = "api.arcade.dev"
@@ -225,3 +235,66 @@ def test_compute_login_url(inputs: dict, expected_output: str):
     login_url = compute_login_url(inputs["host_input"], inputs["state"], inputs["port_input"])
 
     assert login_url == expected_output
+
+
+@pytest.mark.parametrize(
+    "message, expected_output",
+    [
+        pytest.param("No links here.", "No links here.", id="no urls"),
+        pytest.param(
+            "See https://arcade.dev for details.",
+            "See [Link](https://arcade.dev) for details.",
+            id="bare url",
+        ),
+        pytest.param(
+            "See [the docs](https://docs.arcade.dev) and http://localhost:9099",
+            "See [the docs](https://docs.arcade.dev) and [Link](http://localhost:9099)",
+            id="existing markdown link",
+        ),
+    ],
+)
+def test_markdownify_urls(message: str, expected_output: str):
+    assert markdownify_urls(message) == expected_output
+
+
+def test_streaming_markdown_reuses_parsed_markdown_until_enough_new_text():
+    content = StreamingMarkdown()
+    console = Console()
+
+    content.append("Hello")
+    first_render = next(iter(content.__rich_console__(console, console.options)))
+    content.append(" world")
+    assert next(iter(content.__rich_console__(console, console.options))) is first_render
+
+    content.append("\n")
+    new_render = next(iter(content.__rich_console__(console, console.options)))
+    assert new_render is not first_render
+    assert new_render.markup == "Hello world\n"
+
+
+def test_clear_command_keeps_system_prompt():
+    system_message = {"role": "system", "content": "Today is 2024-10-15, Tuesday."}
+    history = [
+        system_message,
+        {"role": "user", "content": "Hello"},
+        {"role": "assistant", "content": "Hi!"},
+    ]
+
+    assert handle_user_command("/clear", history, "localhost", 9099, False, False, print)
+    assert history == [system_message]
+
+
+def test_streaming_response_keeps_tool_authorizations_from_earlier_chunks():
+    authorization = {"id": "1", "status": "pending"}
+
+    def make_chunk(content, tool_authorizations=None):
+        delta = SimpleNamespace(role="assistant", content=content)
+        return SimpleNamespace(
+            choices=[SimpleNamespace(delta=delta, tool_authorizations=tool_authorizations)]
+        )
+
+    response = StreamingResponse()
+    response.add_chunk(make_chunk("", [authorization]))
+    response.add_chunk(make_chunk("Please authorize"))
+
+    assert response.result().tool_authorizations == [authorization]